@@ -374,46 +374,53 @@ const saveResult = async (debateId, analysisResult, analysisSource) => {
 };
 
 const storeResultsInProfiles = async (debate, participants, analysisResult) => {
-  for (const participant of participants) {
-    const userId = participant.user.id;
-    const username = participant.user.username;
-    const opponent = participants.find((p) => p.user.id !== userId);
-
-    const userScore = analysisResult.results[username]?.total || 0;
-    const isWinner = analysisResult.winner === username;
-    let result = isWinner ? "won" : "lost";
-
-    const scores = Object.values(analysisResult.results).map((r) => r.total);
-    if (Math.max(...scores) - Math.min(...scores) <= 5) {
-      result = "draw";
-    }
-
-    await prisma.recentDebate.create({
-      data: {
-        userId,
-        debateId: debate.id,
-        topic: debate.topic,
-        result,
-        score: userScore,
-        participatedAt: new Date(),
-        opponent: opponent?.user.username || "Unknown",
-        analysisSource: analysisResult.analysisSource || "langchain_groq"
-      }
-    });
+  // The draw check depends only on the overall score spread, so compute it once.
+  const scores = Object.values(analysisResult.results).map((r) => r.total);
+  const isDraw = Math.max(...scores) - Math.min(...scores) <= 5;
+
+  // Each participant touches only their own rows, so profiles are updated concurrently.
+  await Promise.all(
+    participants.map(async (participant) => {
+      const userId = participant.user.id;
+      const username = participant.user.username;
+      const opponent = participants.find((p) => p.user.id !== userId);
+
+      const userScore = analysisResult.results[username]?.total || 0;
+      const isWinner = analysisResult.winner === username;
+      const result = isDraw ? "draw" : isWinner ? "won" : "lost";
+
+      await prisma.recentDebate.create({
+        data: {
+          userId,
+          debateId: debate.id,
+          topic: debate.topic,
+          result,
+          score: userScore,
+          participatedAt: new Date(),
+          opponent: opponent?.user.username || "Unknown",
+          analysisSource: analysisResult.analysisSource || "langchain_groq"
+        }
+      });
 
-    const incrementField = result === "won" ? "wins" : result === "lost" ? "losses" : "draws";
-    await prisma.user.update({
-      where: { id: userId },
-      data: {
-        totalDebates: { increment: 1 },
-        [incrementField]: { increment: 1 }
-      }
-    });
+      const incrementField = result === "won" ? "wins" : result === "lost" ? "losses" : "draws";
+      await prisma.user.update({
+        where: { id: userId },
+        data: {
+          totalDebates: { increment: 1 },
+          [incrementField]: { increment: 1 }
+        }
+      });
 
-    const recent = await prisma.recentDebate.findMany({ where: { userId }, orderBy: { participatedAt: "desc" }, take: 10 });
-    const averageScore = recent.length ? recent.reduce((sum, d) => sum + d.score, 0) / recent.length : 0;
-    await prisma.user.update({ where: { id: userId }, data: { averageScore } });
-  }
+      const recent = await prisma.recentDebate.aggregate({
+        where: { userId },
+        orderBy: { participatedAt: "desc" },
+        take: 10,
+        _avg: { score: true }
+      });
+      const averageScore = recent._avg.score ?? 0;
+      await prisma.user.update({ where: { id: userId }, data: { averageScore } });
+    })
+  );
 };
 
 export const finalizeDebate = async (req, res) => {
@@ -563,16 +570,19 @@ export const getResults = async (req, res) => {
     const result = await prisma.result.findUnique({ where: { debateId } });
 
     if (result) {
-      const debate = await prisma.debate.findUnique({
-        where: { id: debateId },
-        include: withParticipants
-      });
+      const [debate, totalArguments] = await Promise.all([
+        prisma.debate.findUnique({
+          where: { id: debateId },
+          include: withParticipants
+        }),
+        prisma.argument.count({ where: { debateId } })
+      ]);
 
       return res.json({
         debateId,
         topic: debate?.topic || "",
         participants: debate?.participants?.map((p) => p.user.username) || [],
-        totalArguments: await prisma.argument.count({ where: { debateId } }),
+        totalArguments,
         winner: result.winner,
         results: result.results,
         analysisSource: result.analysisSource,
@@ -582,16 +592,19 @@ export const getResults = async (req, res) => {
 
     const debate = await prisma.debate.findUnique({ where: { id: debateId } });
     if (debate?.result) {
-      const participants = await prisma.debateParticipant.findMany({
-        where: { debateId },
-        include: { user: { select: { username: true } } }
-      });
+      const [participants, totalArguments] = await Promise.all([
+        prisma.debateParticipant.findMany({
+          where: { debateId },
+          include: { user: { select: { username: true } } }
+        }),
+        prisma.argument.count({ where: { debateId } })
+      ]);
 
       return res.json({
         debateId,
         topic: debate.topic,
         participants: participants.map((p) => p.user.username),
-        totalArguments: await prisma.argument.count({ where: { debateId } }),
+        totalArguments,
         winner: debate.result.winner,
         results: debate.result.results,
         analysisSource: debate.result.analysisSource || "unknown",
@@ -118,7 +118,11 @@ const ensureBoot = async () => {
       setupSocketHandlers(io);
       app.set("io", io);
     }
-  })();
+  })().catch((error) => {
+    // Let the next request retry boot instead of replaying a cached failure.
+    bootPromise = undefined;
+    throw error;
+  });
 
   return bootPromise;
 };
@@ -1,9 +1,11 @@
 import { ChatPromptTemplate } from "@langchain/core/prompts";
 import { RunnableSequence } from "@langchain/core/runnables";
 import { ChatGroq } from "@langchain/groq";
+import extractJsonObject from "../utils/extractJsonObject.js";
 
 const MODEL_TIMEOUT_MS = 14000;
 const MAX_ARGUMENT_CHARS = 9000;
+export const JUDGEMENT_CACHE_SIZE = 100;
 
 const asInt = (value) => {
   const parsed = Number.parseInt(String(value), 10);
@@ -114,75 +116,133 @@ const normalizeResult = (raw) => {
   };
 };
 
-const invokeGroqJudge = async (argumentsArray, topic) => {
+// ChatGroq clients are reused across requests; one is created lazily per temperature.
+const groqModels = new Map();
+
+const getGroqModel = (temperature) => {
+  let model = groqModels.get(temperature);
+  if (!model) {
+    model = new ChatGroq({
+      apiKey: process.env.GROQ_API_KEY,
+      model: process.env.GROQ_MODEL || "llama-3.1-8b-instant",
+      temperature,
+      maxRetries: 1,
+    });
+    groqModels.set(temperature, model);
+  }
+  return model;
+};
+
+const invokeGroqJudge = async (debateText, topic) => {
   if (!process.env.GROQ_API_KEY) {
     throw new Error("GROQ_API_KEY is required for debate judging");
   }
 
-  const model = new ChatGroq({
-    apiKey: process.env.GROQ_API_KEY,
-    model: process.env.GROQ_MODEL || "llama-3.1-8b-instant",
-    temperature: 0,
-    maxRetries: 1,
-  });
-
   const chain = RunnableSequence.from([
     buildPrompt,
-    model,
+    getGroqModel(0),
     async (message) => {
       const raw = Array.isArray(message.content)
         ? message.content.map((item) => (typeof item === "string" ? item : item?.text || "")).join("\n")
         : String(message.content || "");
-      const jsonMatch = raw.match(/\{[\s\S]*\}/);
-      if (!jsonMatch) throw new Error("Groq output did not include JSON");
-      return JSON.parse(jsonMatch[0]);
+      const json = extractJsonObject(raw);
+      if (!json) throw new Error("Groq output did not include JSON");
+      return JSON.parse(json);
     },
   ]);
 
   return Promise.race([
     chain.invoke({
       topic: topic || "General debate",
-      debateText: compactTranscript(argumentsArray),
+      debateText,
     }),
     new Promise((_, reject) => setTimeout(() => reject(new Error("Groq judge timeout")), MODEL_TIMEOUT_MS)),
   ]);
 };
 
+// Concurrent finalizations of the same debate (e.g. both participants approving
+// at once) share a single in-flight Groq call instead of each issuing their own.
+const inflightJudgements = new Map();
+
+// The judge runs at temperature 0, so a retried finalization of an unchanged
+// transcript reuses the previous verdict. Only verdicts that pass normalizeResult
+// are stored. Map insertion order doubles as LRU order.
+const judgementCache = new Map();
+
+const judgeTranscript = (argumentsArray, topic) => {
+  const debateText = compactTranscript(argumentsArray);
+  const key = `${topic || ""}\n${debateText}`;
+
+  if (judgementCache.has(key)) {
+    const cached = judgementCache.get(key);
+    judgementCache.delete(key);
+    judgementCache.set(key, cached);
+    return Promise.resolve(cached);
+  }
+
+  const pending = inflightJudgements.get(key);
+  if (pending) return pending;
+
+  const request = invokeGroqJudge(debateText, topic)
+    .then((raw) => {
+      const verdict = normalizeResult(raw);
+      judgementCache.set(key, verdict);
+      if (judgementCache.size > JUDGEMENT_CACHE_SIZE) {
+        judgementCache.delete(judgementCache.keys().next().value);
+      }
+      return verdict;
+    })
+    .finally(() => {
+      inflightJudgements.delete(key);
+    });
+  inflightJudgements.set(key, request);
+  return request;
+};
+
 export const analyzeDebateForBackend = async (argumentsArray, topic) => {
-  const normalizedArgs = argumentsArray.map((arg) => ({
-    username: arg.username || "Anonymous",
-    argumentText: arg.argumentText || arg.content || "",
-    content: arg.content || arg.argumentText || "",
-    timestamp: arg.timestamp,
-    userId: arg.userId,
-  }));
-
-  const result = await invokeGroqJudge(normalizedArgs, topic);
-  const parsed = normalizeResult(result);
-
-  const perUserStats = normalizedArgs.reduce((acc, arg) => {
-    if (!acc[arg.username]) {
-      acc[arg.username] = { count: 0, chars: 0 };
-    }
-    acc[arg.username].count += 1;
-    acc[arg.username].chars += (arg.argumentText || "").length;
-    return acc;
-  }, {});
+  // Normalize arguments and collect per-user stats in a single pass.
+  const normalizedArgs = [];
+  const perUserStats = {};
+  for (const arg of argumentsArray) {
+    const username = arg.username || "Anonymous";
+    const argumentText = arg.argumentText || arg.content || "";
+    normalizedArgs.push({
+      username,
+      argumentText,
+      content: arg.content || arg.argumentText || "",
+      timestamp: arg.timestamp,
+      userId: arg.userId,
+    });
 
-  for (const username of Object.keys(parsed.results)) {
+    const stat = perUserStats[username] || (perUserStats[username] = { count: 0, chars: 0 });
+    stat.count += 1;
+    stat.chars += argumentText.length;
+  }
+
+  // The verdict may be shared through the cache, so copy each entry before adding stats.
+  const verdict = await judgeTranscript(normalizedArgs, topic);
+  const results = {};
+  for (const [username, value] of Object.entries(verdict.results)) {
     const stat = perUserStats[username] || { count: 0, chars: 0 };
-    parsed.results[username].argumentCount = stat.count;
-    parsed.results[username].averageLength = stat.count ? Math.round(stat.chars / stat.count) : 0;
+    results[username] = {
+      ...value,
+      argumentCount: stat.count,
+      averageLength: stat.count ? Math.round(stat.chars / stat.count) : 0,
+    };
   }
 
   return {
-    results: parsed.results,
-    winner: parsed.winner,
+    results,
+    winner: verdict.winner,
     analysisSource: "langchain_groq",
     finalizedAt: new Date(),
   };
 };
 
+const descriptionPrompt = ChatPromptTemplate.fromTemplate(
+  `Write a concise neutral debate description in 2 sentences for: {topic}. Return plain text only.`
+);
+
 const fallbackDebateDescription = (topic) =>
   `Debate the topic "${topic}" by presenting clear claims, evidence, and rebuttals.`;
 
@@ -191,18 +251,11 @@ export const generateDebateDescription = async (topic) => {
   if (!process.env.GROQ_API_KEY) return fallbackDebateDescription(topic);
 
   try {
-    const model = new ChatGroq({
-      apiKey: process.env.GROQ_API_KEY,
-      model: process.env.GROQ_MODEL || "llama-3.1-8b-instant",
-      temperature: 0.2,
-      maxRetries: 1,
-    });
-
-    const prompt = ChatPromptTemplate.fromTemplate(
-      `Write a concise neutral debate description in 2 sentences for: {topic}. Return plain text only.`
-    );
-
-    const chain = RunnableSequence.from([prompt, model, (msg) => String(msg.content || "").trim()]);
+    const chain = RunnableSequence.from([
+      descriptionPrompt,
+      getGroqModel(0.2),
+      (msg) => String(msg.content || "").trim(),
+    ]);
     const output = await Promise.race([
       chain.invoke({ topic }),
       new Promise((_, reject) => setTimeout(() => reject(new Error("Groq description timeout")), 3000)),
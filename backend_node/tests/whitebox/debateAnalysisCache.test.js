@@ -0,0 +1,101 @@
+import test, { before, beforeEach, mock } from 'node:test';
+import assert from 'node:assert/strict';
+import { register } from 'node:module';
+
+// Swap LangChain for a local stub so Groq calls can be counted without network access.
+register('./stubs/langchainHooks.js', import.meta.url);
+process.env.GROQ_API_KEY = 'test-key';
+
+const { analyzeDebateForBackend, JUDGEMENT_CACHE_SIZE } = await import('../../services/debateAnalysisService.js');
+const { groqStub } = await import('./stubs/langchain.js');
+
+const validReply = JSON.stringify({
+  winner: 'alice',
+  results: { alice: { total: 80 }, bob: { total: 60 } },
+});
+
+// Each tag yields a distinct transcript, and therefore a distinct cache key.
+const debate = (tag) => [
+  { username: 'alice', content: `alice argues ${tag}` },
+  { username: 'bob', content: `bob rebuts ${tag}` },
+];
+
+// The judge's timeout timer is never needed here; mocking it keeps the run from idling on it.
+before(() => {
+  mock.timers.enable({ apis: ['setTimeout'] });
+});
+
+beforeEach(() => {
+  groqStub.calls = 0;
+  groqStub.reply = () => validReply;
+});
+
+test('concurrent analyses of the same transcript share one Groq call', async () => {
+  groqStub.reply = () => new Promise((resolve) => setImmediate(() => resolve(validReply)));
+
+  const [first, second] = await Promise.all([
+    analyzeDebateForBackend(debate('coalesce'), 'Topic'),
+    analyzeDebateForBackend(debate('coalesce'), 'Topic'),
+  ]);
+
+  assert.equal(groqStub.calls, 1);
+  assert.equal(first.winner, 'alice');
+  assert.equal(second.winner, 'alice');
+});
+
+test('a rejected in-flight call is cleared so the next call retries', async () => {
+  let attempt = 0;
+  groqStub.reply = () => {
+    attempt += 1;
+    if (attempt === 1) throw new Error('Groq unavailable');
+    return validReply;
+  };
+
+  await assert.rejects(analyzeDebateForBackend(debate('inflight-retry'), 'Topic'), /Groq unavailable/);
+  const result = await analyzeDebateForBackend(debate('inflight-retry'), 'Topic');
+
+  assert.equal(groqStub.calls, 2);
+  assert.equal(result.winner, 'alice');
+});
+
+test('a repeated transcript reuses the cached verdict', async () => {
+  const first = await analyzeDebateForBackend(debate('cached'), 'Topic');
+  first.results.alice.argumentCount = 99;
+  const second = await analyzeDebateForBackend(debate('cached'), 'Topic');
+
+  assert.equal(groqStub.calls, 1);
+  assert.equal(second.winner, 'alice');
+  assert.equal(second.results.alice.total, 80);
+  assert.equal(second.results.alice.argumentCount, 1);
+});
+
+test('an invalid verdict is not cached', async () => {
+  let attempt = 0;
+  groqStub.reply = () => {
+    attempt += 1;
+    return attempt === 1 ? JSON.stringify({ winner: 'nobody', results: { alice: {}, bob: {} } }) : validReply;
+  };
+
+  await assert.rejects(analyzeDebateForBackend(debate('invalid'), 'Topic'), /invalid winner/);
+  const result = await analyzeDebateForBackend(debate('invalid'), 'Topic');
+
+  assert.equal(groqStub.calls, 2);
+  assert.equal(result.winner, 'alice');
+});
+
+test('the verdict cache evicts its least recently used entry', async () => {
+  await analyzeDebateForBackend(debate('lru-kept'), 'Topic');
+  await analyzeDebateForBackend(debate('lru-evicted'), 'Topic');
+  // Touch the older entry so the second one becomes the least recently used.
+  await analyzeDebateForBackend(debate('lru-kept'), 'Topic');
+  for (let i = 0; i < JUDGEMENT_CACHE_SIZE - 1; i += 1) {
+    await analyzeDebateForBackend(debate(`lru-fill-${i}`), 'Topic');
+  }
+  assert.equal(groqStub.calls, JUDGEMENT_CACHE_SIZE + 1);
+
+  await analyzeDebateForBackend(debate('lru-kept'), 'Topic');
+  assert.equal(groqStub.calls, JUDGEMENT_CACHE_SIZE + 1);
+
+  await analyzeDebateForBackend(debate('lru-evicted'), 'Topic');
+  assert.equal(groqStub.calls, JUDGEMENT_CACHE_SIZE + 2);
+});
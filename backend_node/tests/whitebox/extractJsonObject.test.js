@@ -0,0 +1,17 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+
+import extractJsonObject from '../../utils/extractJsonObject.js';
+
+test('extractJsonObject returns the outermost object surrounded by prose', () => {
+  const raw = 'Here is the verdict:\n{"winner": "a", "results": {"a": {"total": 80}}}\nThanks!';
+  assert.equal(extractJsonObject(raw), '{"winner": "a", "results": {"a": {"total": 80}}}');
+});
+
+test('extractJsonObject matches the previous greedy regex on edge cases', () => {
+  const samples = ['no json here', '} before {', '{ unterminated', '{}', 'a {1} b {2} c'];
+  for (const sample of samples) {
+    const match = sample.match(/\{[\s\S]*\}/);
+    assert.equal(extractJsonObject(sample), match ? match[0] : null);
+  }
+});
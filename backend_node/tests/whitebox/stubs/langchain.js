@@ -0,0 +1,29 @@
+// Minimal stand-ins for the LangChain exports used by debateAnalysisService.
+// Tests drive the fake Groq model through globalThis.groqStub.
+export const groqStub = (globalThis.groqStub = {
+  calls: 0,
+  reply: () => '{}',
+});
+
+export const ChatPromptTemplate = {
+  fromTemplate: () => ({ invoke: async (input) => input }),
+};
+
+export class ChatGroq {
+  async invoke(input) {
+    groqStub.calls += 1;
+    return { content: await groqStub.reply(input) };
+  }
+}
+
+export const RunnableSequence = {
+  from: (steps) => ({
+    invoke: async (input) => {
+      let value = input;
+      for (const step of steps) {
+        value = typeof step === 'function' ? await step(value) : await step.invoke(value);
+      }
+      return value;
+    },
+  }),
+};
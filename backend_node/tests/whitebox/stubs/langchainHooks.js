@@ -0,0 +1,9 @@
+// Module resolve hook that points every @langchain/* import at the local stub.
+const stubUrl = new URL('./langchain.js', import.meta.url).href;
+
+export async function resolve(specifier, context, nextResolve) {
+  if (specifier.startsWith('@langchain/')) {
+    return { url: stubUrl, shortCircuit: true };
+  }
+  return nextResolve(specifier, context);
+}
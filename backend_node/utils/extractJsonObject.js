@@ -0,0 +1,12 @@
+// utils/extractJsonObject.js
+// Returns the outermost {...} span of a model reply, or null if there is none.
+// Equivalent to matching /\{[\s\S]*\}/ but without regex backtracking.
+export default function extractJsonObject(text) {
+  const start = text.indexOf("{");
+  if (start === -1) return null;
+
+  const end = text.lastIndexOf("}");
+  if (end < start) return null;
+
+  return text.slice(start, end + 1);
+}